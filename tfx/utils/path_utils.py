@@ -60,9 +60,9 @@ def eval_model_dir(output_uri: Text) -> Text:
 def eval_model_path(output_uri: Text) -> Text:
   """Returns path to timestamped exported model for evaluation purpose."""
   model_dir = eval_model_dir(output_uri)
-  if tf.io.gfile.exists(model_dir):
+  try:
     return io_utils.get_only_uri_in_dir(model_dir)
-  else:
+  except tf.errors.NotFoundError:
     # If eval model doesn't exist, use serving model for eval.
     return serving_model_dir(output_uri)
 
@@ -75,12 +75,14 @@ def serving_model_dir(output_uri: Text) -> Text:
 def serving_model_path(output_uri: Text) -> Text:
   """Returns path for timestamped and named serving model exported."""
   export_dir = os.path.join(serving_model_dir(output_uri), 'export')
-  if tf.io.gfile.exists(export_dir):
+  # listdir already checks that the directory exists, so a separate exists()
+  # probe would only cost an extra filesystem round trip.
+  try:
     model_dir = io_utils.get_only_uri_in_dir(export_dir)
-    return io_utils.get_only_uri_in_dir(model_dir)
-  else:
+  except tf.errors.NotFoundError:
     # If dir doesn't match estimator structure, use serving model root directly.
     return serving_model_dir(output_uri)
+  return io_utils.get_only_uri_in_dir(model_dir)
 
 
 def get_serving_model_version(output_uri: Text) -> Text: